@@ -0,0 +1,64 @@
+"""
+Fallback Components for the Agricultural Advisory System
+
+Minimal stand-ins for the notebook-exported components (cell_32 through
+cell_35) so the Streamlit app stays usable when those modules are not
+importable. Defining them here instead of inside the app's ImportError
+handler keeps the cold-import path small.
+"""
+
+import copy
+
+# The stub report is a constant; build it once at import time and hand
+# out copies instead of re-allocating the nested dicts per call
+_FALLBACK_REPORT = {
+    "executive_summary": {
+        "soil_quality_score": 0.7,
+        "recommended_crops": ["maize", "beans"],
+        "overall_recommendation_valid": True,
+        "uncertainty_level": "medium"
+    },
+    "detailed_analysis": {
+        "soil_analysis": {"strengths": ["Good pH"], "weaknesses": ["Low organic matter"]},
+        "recommendations": {"crops": ["maize", "beans"], "confidence": 0.8, "source": "github_models"},
+        "cropping_plan": {"summary": {"total_yield": 5000, "total_cost": 3000, "total_profit": 2000}}
+    },
+    "actionable_recommendations": ["Apply organic matter", "Plant maize and beans"],
+    "risk_assessment": {"high_risk_factors": [], "medium_risk_factors": ["Weather variability"], "low_risk_factors": [], "mitigation_strategies": []}
+}
+
+
+class AgronomicRuleEngine:
+    def __init__(self):
+        pass
+
+    def validate_recommendation(self, soil_profile, crop_recommendation):
+        return {"is_valid": True, "violations": [], "confidence_score": 0.8}
+
+
+class UncertaintyCalibrator:
+    def __init__(self):
+        pass
+
+    def calibrate_prediction_uncertainty(self, predictions, true_labels):
+        return {"confidence_level": 0.95, "calibration_metrics": {"empirical_coverage": 0.95}}
+
+
+class MultiObjectiveCroppingPlanner:
+    def __init__(self):
+        pass
+
+    def plan_cropping_system(self, soil_profile, constraints, objectives):
+        return {"summary": {"crops": ["maize", "beans"], "total_yield": 5000, "total_cost": 3000, "total_profit": 2000}}
+
+
+class IntegratedAgriculturalAdvisor:
+    def __init__(self):
+        self.rule_engine = AgronomicRuleEngine()
+        self.uncertainty_calibrator = UncertaintyCalibrator()
+        self.cropping_planner = MultiObjectiveCroppingPlanner()
+
+    def analyze_soil_and_recommend(self, soil_data, constraints, objectives):
+        # Deep copy so callers can mutate their report without corrupting
+        # the shared constant
+        return copy.deepcopy(_FALLBACK_REPORT)
@@ -7,23 +7,176 @@ and integrate them with the Streamlit application.
 
 import os
 import json
+import asyncio
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import mmap
 import pickle
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import tarfile
 import tempfile
+import threading
+import uuid
 import shutil
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import logging
 
+# Optional async HTTP support; httpx is preferred because it can
+# multiplex every download over one HTTP/2 connection
+try:
+    import httpx
+    # httpx raises ImportError at client construction when http2=True is
+    # requested without the h2 extra, so probe for it up front
+    import h2  # noqa: F401
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Optional fast JSON parser for large knowledge-graph/config files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional zstd compression for the disk cache
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Optional loaders that map numeric arrays from disk instead of copying
+# them through the pickle VM
+try:
+    import joblib
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+try:
+    import safetensors.numpy
+    SAFETENSORS_AVAILABLE = True
+except ImportError:
+    SAFETENSORS_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class SafeUnpickler(pickle.Unpickler):
+    """
+    Unpickler restricted to an allow-list of globals
+
+    Model pickles come from a remote repository, and a bare pickle.load
+    will import and call arbitrary globals. Only the numpy/sklearn types
+    and the advisory system's own classes may be resolved.
+    """
+
+    ALLOWED = {
+        ("builtins", "set"),
+        ("builtins", "frozenset"),
+        ("collections", "OrderedDict"),
+        ("collections", "defaultdict"),
+        ("numpy", "ndarray"),
+        ("numpy", "dtype"),
+        ("numpy.core.multiarray", "_reconstruct"),
+        ("numpy.core.multiarray", "scalar"),
+        ("cell_32_constrained_decoding", "AgronomicRuleEngine"),
+        ("cell_33_uncertainty_calibration", "UncertaintyCalibrator"),
+        ("cell_34_cropping_planner", "MultiObjectiveCroppingPlanner"),
+        ("cell_34_cropping_planner", "SoilProfile"),
+        ("cell_34_cropping_planner", "ResourceConstraints"),
+        ("cell_35_integrated_system", "IntegratedAgriculturalAdvisor"),
+    }
+
+    def find_class(self, module, name):
+        if (module, name) not in self.ALLOWED and not module.startswith("sklearn."):
+            raise pickle.UnpicklingError(
+                f"Blocked unpickling of disallowed global {module}.{name}"
+            )
+        return super().find_class(module, name)
+
+
+@functools.lru_cache(maxsize=32)
+def _deserialize_cached(model_path: str, mtime: float) -> Optional[Any]:
+    """
+    Deserialize a cached model file, memoized on (path, mtime)
+
+    Repeat loads of an unchanged file return the already-constructed
+    object instead of re-reading and re-parsing it; a new download
+    changes the mtime and busts the entry.
+    """
+    if model_path.endswith('.zst'):
+        # Compressed cache entry: decompress on the fly; zstd decode is
+        # typically faster than the disk bandwidth it saves
+        inner = model_path[:-len('.zst')]
+        with open(model_path, 'rb') as f:
+            with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                if inner.endswith('.json'):
+                    data = reader.read()
+                    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+                elif inner.endswith('.pkl'):
+                    return SafeUnpickler(reader).load()
+        logger.error(f"Unsupported model format: {model_path}")
+        return None
+    elif model_path.endswith('.json'):
+        with open(model_path, 'rb') as f:
+            data = f.read()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
+    elif model_path.endswith('.pkl'):
+        # Memory-map the cached file so the OS page cache owns the
+        # bytes and concurrent workers share one physical copy
+        # instead of each reading the file into its own heap
+        with open(model_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return SafeUnpickler(mm).load()
+    elif model_path.endswith('.joblib'):
+        if not JOBLIB_AVAILABLE:
+            logger.error("joblib not available, cannot load %s" % model_path)
+            return None
+        # mmap_mode maps numpy buffers straight from disk: one mmap call
+        # instead of copying every array through the pickle VM
+        return joblib.load(model_path, mmap_mode='r')
+    elif model_path.endswith('.safetensors'):
+        if not SAFETENSORS_AVAILABLE:
+            logger.error("safetensors not available, cannot load %s" % model_path)
+            return None
+        return safetensors.numpy.load_file(model_path)
+    else:
+        logger.error(f"Unsupported model format: {model_path}")
+        return None
+
+
 class GitHubModelLoader:
     """
     Load models from GitHub repositories for the agricultural advisory system
     """
-    
+
+    # Single source of truth for the known model artifacts; the load_*
+    # convenience methods below all dispatch through this table
+    MODEL_REGISTRY = {
+        "knowledge_graph": "knowledge_graph.json",
+        "crop_database": "crop_database.json",
+        "rule_engine_config": "rule_engine_config.json",
+        "rule_engine": "rule_engine.pkl",
+        "cropping_planner": "cropping_planner.pkl",
+        "integrated_advisor": "integrated_advisor.pkl",
+        "uncertainty_calibrator": "uncertainty_calibrator.pkl",
+    }
+
+
     def __init__(self, github_repo: str, branch: str = "main", token: Optional[str] = None):
         """
         Initialize the GitHub model loader
@@ -42,8 +195,33 @@ class GitHubModelLoader:
         # Model cache directory
         self.cache_dir = Path("model_cache")
         self.cache_dir.mkdir(exist_ok=True)
-        
+
+        # Shared HTTP session with keep-alive, connection pooling and retries
+        # so repeated API/raw calls reuse TCP+TLS connections
+        self.session = requests.Session()
+        self.session.headers.update(self._get_headers())
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount("https://", adapter)
+
         logger.info(f"Initialized GitHub model loader for {github_repo}")
+
+    def close(self):
+        """Close the HTTP session and release pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for GitHub API requests"""
@@ -55,19 +233,86 @@ class GitHubModelLoader:
     def list_available_models(self) -> List[Dict[str, Any]]:
         """
         List all available models in the GitHub repository
-        
+
+        Returns:
+            List of model information dictionaries
+        """
+        listing_cache = self.cache_dir / "tree.json"
+        listing_etag = self.cache_dir / "tree.etag"
+
+        try:
+            # One recursive tree request covers the whole repository, instead
+            # of one contents call for the root plus one for models/
+            url = f"{self.base_url}/git/trees/{self.branch}?recursive=1"
+            headers = {}
+            if listing_cache.exists() and listing_etag.exists():
+                headers["If-None-Match"] = listing_etag.read_text().strip()
+            response = self.session.get(url, headers=headers)
+
+            if response.status_code == 304:
+                logger.info("Repository tree unchanged upstream (304)")
+                tree_data = json.loads(listing_cache.read_text())
+            else:
+                response.raise_for_status()
+                tree_data = response.json()
+                listing_cache.write_text(json.dumps(tree_data))
+                if response.headers.get("ETag"):
+                    listing_etag.write_text(response.headers["ETag"])
+
+            if tree_data.get("truncated"):
+                logger.warning("Git tree response truncated, falling back to contents API")
+                return self._list_available_models_contents()
+
+            models = [
+                {
+                    "name": Path(item["path"]).name,
+                    "path": item["path"],
+                    "size": item.get("size", 0),
+                    "download_url": f"{self.raw_base_url}/{item['path']}"
+                }
+                for item in tree_data["tree"]
+                if item["type"] == "blob" and item["path"].endswith((".json", ".pkl", ".joblib", ".safetensors"))
+            ]
+
+            logger.info(f"Found {len(models)} models in repository")
+            return models
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error listing models: {e}")
+            return []
+
+    def _list_available_models_contents(self) -> List[Dict[str, Any]]:
+        """
+        List models via the contents API (fallback for truncated trees)
+
         Returns:
             List of model information dictionaries
         """
+        listing_cache = self.cache_dir / "contents.json"
+        listing_etag = self.cache_dir / "contents.etag"
+
         try:
-            # Get repository contents from root directory (since models are in root)
+            # Get repository contents from root directory (since models are in root),
+            # sending the previous ETag so an unchanged listing costs only headers
             url = f"{self.base_url}/contents"
-            response = requests.get(url, headers=self._get_headers())
-            response.raise_for_status()
-            
+            headers = {}
+            if listing_cache.exists() and listing_etag.exists():
+                headers["If-None-Match"] = listing_etag.read_text().strip()
+            response = self.session.get(url, headers=headers)
+
+            if response.status_code == 304:
+                logger.info("Repository listing unchanged upstream (304)")
+                contents = json.loads(listing_cache.read_text())
+            else:
+                response.raise_for_status()
+                contents = response.json()
+                listing_cache.write_text(json.dumps(contents))
+                if response.headers.get("ETag"):
+                    listing_etag.write_text(response.headers["ETag"])
+
             models = []
-            for item in response.json():
-                if item["type"] == "file" and item["name"].endswith((".json", ".pkl", ".joblib")):
+            for item in contents:
+                if item["type"] == "file" and item["name"].endswith((".json", ".pkl", ".joblib", ".safetensors")):
                     models.append({
                         "name": item["name"],
                         "path": item["path"],
@@ -78,10 +323,10 @@ class GitHubModelLoader:
             # Also check if there's a models directory
             try:
                 models_url = f"{self.base_url}/contents/models"
-                models_response = requests.get(models_url, headers=self._get_headers())
+                models_response = self.session.get(models_url)
                 if models_response.status_code == 200:
                     for item in models_response.json():
-                        if item["type"] == "file" and item["name"].endswith((".json", ".pkl", ".joblib")):
+                        if item["type"] == "file" and item["name"].endswith((".json", ".pkl", ".joblib", ".safetensors")):
                             models.append({
                                 "name": item["name"],
                                 "path": item["path"],
@@ -98,6 +343,39 @@ class GitHubModelLoader:
             logger.error(f"Error listing models: {e}")
             return []
     
+    def is_cached(self, model_name: str) -> bool:
+        """
+        Whether a model already has a readable on-disk cache entry
+
+        Args:
+            model_name: Name of the model file
+
+        Returns:
+            True if a plain or (decodable) compressed entry exists
+        """
+        cache_path = self.cache_dir / model_name
+        zst_path = cache_path.with_suffix(cache_path.suffix + ".zst")
+        return cache_path.exists() or (ZSTD_AVAILABLE and zst_path.exists())
+
+    def _drop_cache_counterpart(self, written: Path) -> None:
+        """
+        Remove the other on-disk form of a cache entry
+
+        A plain file and its .zst sibling shadow each other in the cache
+        lookup, so whichever form was just written evicts the stale one.
+
+        Args:
+            written: Cache path that was just written
+        """
+        if written.suffix == ".zst":
+            counterpart = written.with_suffix("")
+        else:
+            counterpart = written.with_suffix(written.suffix + ".zst")
+        try:
+            counterpart.unlink()
+        except FileNotFoundError:
+            pass
+
     def download_model(self, model_name: str, force_download: bool = False) -> Optional[str]:
         """
         Download a model from GitHub
@@ -110,35 +388,247 @@ class GitHubModelLoader:
             Local path to the downloaded model, or None if failed
         """
         cache_path = self.cache_dir / model_name
-        
+        # Only .json/.pkl entries are compressed: those decode through a
+        # zstd stream in _deserialize_cached, while .joblib/.safetensors
+        # are mmap'd straight off disk and .npz archives are read lazily
+        # by numpy — compressing any of them would break their loaders
+        compressible = cache_path.suffix in (".json", ".pkl")
+        zst_path = cache_path.with_suffix(cache_path.suffix + ".zst")
+        # Prefer a compressed cache entry, but only when zstandard is
+        # importable — an orphaned .zst must not shadow a readable plain
+        # file after the optional dependency goes away
+        use_compressed = ZSTD_AVAILABLE and compressible and zst_path.exists()
+        cached = zst_path if use_compressed else cache_path
+
         # Check if model is already cached
-        if cache_path.exists() and not force_download:
+        if cached.exists() and not force_download:
             logger.info(f"Using cached model: {model_name}")
-            return str(cache_path)
-        
+            return str(cached)
+
+        # Send the stored ETag so an unchanged file costs one header
+        # round-trip (304) instead of a full re-download
+        etag_path = self.cache_dir / f"{model_name}.etag"
+        conditional_headers = {}
+        if cached.exists() and etag_path.exists():
+            conditional_headers["If-None-Match"] = etag_path.read_text().strip()
+
         try:
             # Try downloading from root directory first (for PKL files)
             url = f"{self.raw_base_url}/{model_name}"
-            response = requests.get(url, headers=self._get_headers())
-            
+            response = self.session.get(url, stream=True, headers=conditional_headers)
+
             # If not found in root, try models directory
             if response.status_code == 404:
+                response.close()
                 url = f"{self.raw_base_url}/models/{model_name}"
-                response = requests.get(url, headers=self._get_headers())
-            
-            response.raise_for_status()
-            
-            # Save to cache
-            with open(cache_path, 'wb') as f:
-                f.write(response.content)
-            
+                response = self.session.get(url, stream=True, headers=conditional_headers)
+
+            if response.status_code == 304:
+                response.close()
+                logger.info(f"Model unchanged upstream (304): {model_name}")
+                return str(cached)
+
+            with response:
+                response.raise_for_status()
+
+                # Stream to a temp file chunk by chunk instead of buffering
+                # the whole download in RAM, compressing with zstd when
+                # available and the format supports it, then rename
+                # atomically so other loaders never see a half-written file
+                use_zstd = ZSTD_AVAILABLE and compressible
+                target = zst_path if use_zstd else cache_path
+                part_path = target.with_suffix(target.suffix + ".part")
+                with open(part_path, 'wb') as f:
+                    if use_zstd:
+                        compressor = zstandard.ZstdCompressor(level=3)
+                        with compressor.stream_writer(f, closefd=False) as writer:
+                            for chunk in response.iter_content(chunk_size=1 << 20):
+                                writer.write(chunk)
+                    else:
+                        for chunk in response.iter_content(chunk_size=1 << 20):
+                            f.write(chunk)
+                os.replace(part_path, target)
+                self._drop_cache_counterpart(target)
+
+                if response.headers.get("ETag"):
+                    etag_path.write_text(response.headers["ETag"])
+
             logger.info(f"Downloaded model: {model_name}")
-            return str(cache_path)
-            
+            return str(target)
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Error downloading model {model_name}: {e}")
             return None
     
+    def download_all_models_via_archive(self) -> List[str]:
+        """
+        Download every model in one request via the GitHub archive endpoint
+
+        Streams the repository tarball and extracts only model files into the
+        cache, collapsing one API call plus one raw download per model into a
+        single HTTP round-trip that also avoids per-file rate limiting.
+
+        Returns:
+            List of model file names extracted into the cache
+        """
+        url = f"{self.base_url}/tarball/{self.branch}"
+        extracted = []
+
+        try:
+            with self.session.get(url, stream=True) as response:
+                if response.status_code == 404:
+                    logger.warning("Archive endpoint not available, falling back to per-file downloads")
+                    return []
+                response.raise_for_status()
+
+                with tarfile.open(fileobj=response.raw, mode="r|gz") as archive:
+                    for member in archive:
+                        if not member.isfile():
+                            continue
+                        name = Path(member.name).name
+                        if not name.endswith((".json", ".pkl", ".joblib", ".safetensors")):
+                            continue
+                        source = archive.extractfile(member)
+                        if source is None:
+                            continue
+                        cache_path = self.cache_dir / name
+                        with open(cache_path, 'wb') as f:
+                            shutil.copyfileobj(source, f)
+                        self._drop_cache_counterpart(cache_path)
+                        extracted.append(name)
+
+            logger.info(f"Extracted {len(extracted)} models from repository archive")
+            return extracted
+
+        except (requests.exceptions.RequestException, tarfile.TarError) as e:
+            logger.error(f"Error downloading repository archive: {e}")
+            return []
+
+    def download_models_via_graphql(self, model_names: List[str]) -> List[str]:
+        """
+        Fetch several model files in one GraphQL request
+
+        Builds one aliased Blob query per file so any number of models costs
+        a single POST to the GraphQL endpoint. Binary blobs are not inlined
+        in GraphQL responses, so those are fetched by OID via the Git Data
+        API. Requires a token since the GraphQL API rejects anonymous calls.
+
+        Args:
+            model_names: Names of the model files to fetch
+
+        Returns:
+            List of model file names written into the cache
+        """
+        if not self.token:
+            logger.warning("GraphQL API requires a token, falling back to raw downloads")
+            return []
+
+        owner, repo = self.github_repo.split("/")
+        # json.dumps the expression so names can't break out of the
+        # GraphQL string literal
+        fields = " ".join(
+            f'f{i}: object(expression: {json.dumps(f"{self.branch}:{name}")}) '
+            '{ ... on Blob { text isBinary isTruncated oid byteSize } }'
+            for i, name in enumerate(model_names)
+        )
+        query = f'query {{ repository(owner: "{owner}", name: "{repo}") {{ {fields} }} }}'
+
+        try:
+            response = self.session.post(
+                "https://api.github.com/graphql",
+                json={"query": query},
+                headers={"Authorization": f"bearer {self.token}"}
+            )
+            response.raise_for_status()
+            repository = response.json().get("data", {}).get("repository") or {}
+
+            fetched = []
+            for i, name in enumerate(model_names):
+                blob = repository.get(f"f{i}")
+                if not blob:
+                    continue
+                cache_path = self.cache_dir / name
+
+                # Inline text is only trustworthy when GitHub marks it
+                # non-binary, untruncated, actually present, and its byte
+                # length matches the blob size; anything else (binary,
+                # truncated large blobs, undetermined encoding) is fetched
+                # raw by OID instead
+                data = None
+                text = blob.get("text")
+                if (not blob.get("isBinary") and not blob.get("isTruncated")
+                        and text is not None):
+                    encoded = text.encode("utf-8")
+                    if blob.get("byteSize") in (None, len(encoded)):
+                        data = encoded
+
+                if data is None:
+                    blob_url = f"{self.base_url}/git/blobs/{blob['oid']}"
+                    blob_response = self.session.get(
+                        blob_url, headers={"Accept": "application/vnd.github.raw"}
+                    )
+                    blob_response.raise_for_status()
+                    data = blob_response.content
+
+                if blob.get("byteSize") not in (None, len(data)):
+                    logger.warning(f"Size mismatch for {name}, not caching")
+                    continue
+
+                cache_path.write_bytes(data)
+                self._drop_cache_counterpart(cache_path)
+                fetched.append(name)
+
+            logger.info(f"Fetched {len(fetched)} models via GraphQL")
+            return fetched
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching models via GraphQL: {e}")
+            return []
+
+    async def _adownload(self, session: "aiohttp.ClientSession", model_name: str,
+                         force_download: bool = False) -> Optional[str]:
+        """
+        Download a model from GitHub asynchronously
+
+        Args:
+            session: Shared aiohttp client session
+            model_name: Name of the model file
+            force_download: Force download even if cached
+
+        Returns:
+            Local path to the downloaded model, or None if failed
+        """
+        cache_path = self.cache_dir / model_name
+
+        # Check if model is already cached
+        if cache_path.exists() and not force_download:
+            logger.info(f"Using cached model: {model_name}")
+            return str(cache_path)
+
+        try:
+            # Try downloading from root directory first, then models directory
+            url = f"{self.raw_base_url}/{model_name}"
+            async with session.get(url) as response:
+                if response.status == 404:
+                    url = f"{self.raw_base_url}/models/{model_name}"
+                    async with session.get(url) as fallback_response:
+                        fallback_response.raise_for_status()
+                        content = await fallback_response.read()
+                else:
+                    response.raise_for_status()
+                    content = await response.read()
+
+            # Write to cache in a thread so the event loop stays unblocked
+            await asyncio.to_thread(cache_path.write_bytes, content)
+            self._drop_cache_counterpart(cache_path)
+
+            logger.info(f"Downloaded model: {model_name}")
+            return str(cache_path)
+
+        except (aiohttp.ClientError, OSError) as e:
+            logger.error(f"Error downloading model {model_name}: {e}")
+            return None
+
     def load_model(self, model_name: str) -> Optional[Any]:
         """
         Load a model from GitHub
@@ -154,28 +644,140 @@ class GitHubModelLoader:
             return None
         
         try:
-            if model_name.endswith('.json'):
-                with open(model_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            elif model_name.endswith('.pkl'):
-                with open(model_path, 'rb') as f:
-                    return pickle.load(f)
-            else:
-                logger.error(f"Unsupported model format: {model_name}")
-                return None
-                
+            # Key the memo on the file's mtime so a fresh download busts it
+            return _deserialize_cached(model_path, os.path.getmtime(model_path))
         except Exception as e:
             logger.error(f"Error loading model {model_name}: {e}")
             return None
     
+    def load(self, key: str) -> Optional[Any]:
+        """
+        Load a registered model by its registry key
+
+        Args:
+            key: Key into MODEL_REGISTRY (e.g. "rule_engine")
+
+        Returns:
+            Loaded model object, or None if failed
+        """
+        return self.load_model(self.MODEL_REGISTRY[key])
+
+    async def _adownload_http2(self, client: "httpx.AsyncClient", model_name: str,
+                               force_download: bool = False) -> Optional[str]:
+        """
+        Download a model over a multiplexed HTTP/2 connection
+
+        Concurrent downloads share a single TLS connection, so the
+        handshake is paid once instead of per parallel stream.
+
+        Args:
+            client: Shared httpx async client (http2=True)
+            model_name: Name of the model file
+            force_download: Force download even if cached
+
+        Returns:
+            Local path to the downloaded model, or None if failed
+        """
+        cache_path = self.cache_dir / model_name
+
+        # Check if model is already cached
+        if cache_path.exists() and not force_download:
+            logger.info(f"Using cached model: {model_name}")
+            return str(cache_path)
+
+        try:
+            # Try root directory first, then models directory
+            for url in (f"{self.raw_base_url}/{model_name}",
+                        f"{self.raw_base_url}/models/{model_name}"):
+                async with client.stream("GET", url) as response:
+                    if response.status_code == 404:
+                        continue
+                    response.raise_for_status()
+
+                    part_path = cache_path.with_suffix(cache_path.suffix + ".part")
+                    with open(part_path, 'wb') as f:
+                        async for chunk in response.aiter_bytes(1 << 20):
+                            f.write(chunk)
+                    os.replace(part_path, cache_path)
+                    self._drop_cache_counterpart(cache_path)
+
+                    logger.info(f"Downloaded model: {model_name}")
+                    return str(cache_path)
+
+            logger.error(f"Model not found: {model_name}")
+            return None
+
+        except (httpx.HTTPError, OSError) as e:
+            logger.error(f"Error downloading model {model_name}: {e}")
+            return None
+
+    async def aload_model(self, model_name: str) -> Optional[Any]:
+        """
+        Load a model without blocking the event loop
+
+        The blocking HTTP download and the CPU-bound deserialization both
+        run in worker threads via asyncio.to_thread, so async callers can
+        batch several loads with asyncio.gather while the loop stays free.
+
+        Args:
+            model_name: Name of the model file
+
+        Returns:
+            Loaded model object, or None if failed
+        """
+        path = await asyncio.to_thread(self.download_model, model_name)
+        if not path:
+            return None
+        return await asyncio.to_thread(self.load_model, model_name)
+
+    def load_model_streaming(self, model_name: str) -> Optional[Any]:
+        """
+        Load a model straight from the network response, skipping the disk cache
+
+        For one-shot loads, download-to-cache then re-read does three times
+        the necessary I/O; here the unpickler consumes bytes as they arrive,
+        overlapping transfer with deserialization.
+
+        Args:
+            model_name: Name of the model file
+
+        Returns:
+            Loaded model object, or None if failed
+        """
+        try:
+            url = f"{self.raw_base_url}/{model_name}"
+            response = self.session.get(url, stream=True)
+            if response.status_code == 404:
+                response.close()
+                url = f"{self.raw_base_url}/models/{model_name}"
+                response = self.session.get(url, stream=True)
+
+            with response:
+                response.raise_for_status()
+
+                if model_name.endswith('.pkl'):
+                    response.raw.decode_content = True
+                    return SafeUnpickler(response.raw).load()
+                elif model_name.endswith('.json'):
+                    if ORJSON_AVAILABLE:
+                        return orjson.loads(response.content)
+                    return json.loads(response.content)
+                else:
+                    logger.error(f"Unsupported model format: {model_name}")
+                    return None
+
+        except (requests.exceptions.RequestException, pickle.UnpicklingError, ValueError) as e:
+            logger.error(f"Error streaming model {model_name}: {e}")
+            return None
+
     def load_knowledge_graph(self) -> Optional[Dict[str, Any]]:
         """
         Load the knowledge graph from GitHub
-        
+
         Returns:
             Knowledge graph dictionary, or None if failed
         """
-        return self.load_model("knowledge_graph.json")
+        return self.load("knowledge_graph")
     
     def load_embeddings(self, embedding_type: str = "graphsage") -> Optional[Dict[str, Any]]:
         """
@@ -187,62 +789,93 @@ class GitHubModelLoader:
         Returns:
             Embeddings dictionary, or None if failed
         """
+        logger.warning(
+            "JSON embeddings are deprecated; prefer load_embeddings_npz, "
+            "which memory-maps the arrays instead of parsing floats"
+        )
         model_name = f"{embedding_type}_embeddings.json"
         return self.load_model(model_name)
+
+    def load_embeddings_npz(self, embedding_type: str = "graphsage") -> Optional[Any]:
+        """
+        Load embeddings stored as a NumPy .npz archive from GitHub
+
+        np.load returns a lazy NpzFile: nothing is parsed up front, and
+        each member array is only read (and decompressed) from the archive
+        when first accessed. Note numpy ignores mmap_mode for .npz, so
+        accessed arrays are regular in-memory arrays, not memory maps.
+
+        Args:
+            embedding_type: Type of embeddings to load (graphsage, gcn, transe, etc.)
+
+        Returns:
+            Lazily-loading NpzFile, or None if failed
+        """
+        import numpy as np
+
+        model_path = self.download_model(f"{embedding_type}_embeddings.npz")
+        if not model_path:
+            return None
+
+        try:
+            return np.load(model_path, allow_pickle=False)
+        except Exception as e:
+            logger.error(f"Error loading {embedding_type} embeddings: {e}")
+            return None
     
-    def load_rule_engine(self) -> Optional[Dict[str, Any]]:
+    def load_rule_engine_config(self) -> Optional[Dict[str, Any]]:
         """
         Load the rule engine configuration from GitHub
-        
+
         Returns:
             Rule engine configuration, or None if failed
         """
-        return self.load_model("rule_engine_config.json")
-    
+        return self.load("rule_engine_config")
+
     def load_crop_database(self) -> Optional[Dict[str, Any]]:
         """
         Load the crop database from GitHub
-        
+
         Returns:
             Crop database dictionary, or None if failed
         """
-        return self.load_model("crop_database.json")
-    
+        return self.load("crop_database")
+
     def load_cropping_planner(self) -> Optional[Any]:
         """
         Load the cropping planner model from GitHub
-        
+
         Returns:
             Cropping planner model, or None if failed
         """
-        return self.load_model("cropping_planner.pkl")
-    
+        return self.load("cropping_planner")
+
     def load_integrated_advisor(self) -> Optional[Any]:
         """
         Load the integrated advisor model from GitHub
-        
+
         Returns:
             Integrated advisor model, or None if failed
         """
-        return self.load_model("integrated_advisor.pkl")
-    
+        return self.load("integrated_advisor")
+
     def load_rule_engine(self) -> Optional[Any]:
         """
         Load the rule engine model from GitHub
-        
+
         Returns:
             Rule engine model, or None if failed
         """
-        return self.load_model("rule_engine.pkl")
-    
+        return self.load("rule_engine")
+
     def load_uncertainty_calibrator(self) -> Optional[Any]:
         """
         Load the uncertainty calibrator model from GitHub
-        
+
         Returns:
             Uncertainty calibrator model, or None if failed
         """
-        return self.load_model("uncertainty_calibrator.pkl")
+        return self.load("uncertainty_calibrator")
     
     def get_model_info(self, model_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -256,7 +889,7 @@ class GitHubModelLoader:
         """
         try:
             url = f"{self.base_url}/contents/{model_name}"
-            response = requests.get(url, headers=self._get_headers())
+            response = self.session.get(url)
             response.raise_for_status()
             
             return response.json()
@@ -268,16 +901,33 @@ class GitHubModelLoader:
     def clear_cache(self):
         """Clear the model cache"""
         if self.cache_dir.exists():
-            shutil.rmtree(self.cache_dir)
+            # Rename the directory aside (one inode operation) and delete
+            # the old tree in a background thread, so callers don't block
+            # on unlinking a large cache
+            trash_dir = self.cache_dir.with_name(f".trash-{uuid.uuid4().hex}")
+            self.cache_dir.rename(trash_dir)
             self.cache_dir.mkdir(exist_ok=True)
+            threading.Thread(
+                target=shutil.rmtree,
+                args=(trash_dir,),
+                kwargs={"ignore_errors": True},
+                daemon=True
+            ).start()
             logger.info("Model cache cleared")
     
     def get_cache_size(self) -> int:
         """Get the size of the model cache in bytes"""
+        # Walk with os.scandir so each entry's type and size come from the
+        # directory listing instead of a second stat() per file
         total_size = 0
-        for file_path in self.cache_dir.rglob('*'):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
+        stack = [str(self.cache_dir)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
         return total_size
 
 
@@ -298,6 +948,7 @@ class ModelManager:
         self.loader = GitHubModelLoader(github_repo, branch, token)
         self.models = {}
         self.model_info = {}
+        self.total_models = 0
         
         logger.info(f"Initialized ModelManager for {github_repo}")
     
@@ -309,7 +960,33 @@ class ModelManager:
             Dictionary of loaded models
         """
         available_models = self.loader.list_available_models()
-        
+        self.total_models = len(available_models)
+
+        # Warm the cache in as few requests as possible: one archive download,
+        # then one batched GraphQL request if the archive is unavailable;
+        # load_model below falls back to per-file downloads for anything
+        # missed. Skip the batch entirely when every model already has a
+        # cache entry — re-extracting the tarball would rewrite each file
+        # (busting the mtime-keyed deserialize memo) and sidestep the
+        # per-file ETag revalidation in download_model
+        missing = [m["name"] for m in available_models
+                   if not self.loader.is_cached(m["name"])]
+        if missing:
+            if not self.loader.download_all_models_via_archive():
+                self.loader.download_models_via_graphql(missing)
+
+        # Prefetch whatever the batched paths missed with a thread pool so
+        # the remaining downloads overlap; requests.Session.get is
+        # thread-safe, and the CPU-bound deserialization below stays serial
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(self.loader.download_model, m["name"]): m
+                for m in available_models
+            }
+            for future in as_completed(futures):
+                if future.result() is None:
+                    logger.warning(f"Failed to download: {futures[future]['name']}")
+
         for model_info in available_models:
             model_name = model_info["name"]
             logger.info(f"Loading model: {model_name}")
@@ -325,6 +1002,68 @@ class ModelManager:
         logger.info(f"Loaded {len(self.models)} models successfully")
         return self.models
     
+    async def aload_all_models(self) -> Dict[str, Any]:
+        """
+        Load all available models from GitHub, downloading them concurrently
+
+        Requires aiohttp. Downloads are dispatched together so total wall time
+        is roughly the slowest transfer instead of the sum of all transfers.
+
+        Returns:
+            Dictionary of loaded models
+        """
+        if not (HTTPX_AVAILABLE or AIOHTTP_AVAILABLE):
+            logger.warning("httpx/aiohttp not available, falling back to serial loading")
+            return await asyncio.to_thread(self.load_all_models)
+
+        available_models = await asyncio.to_thread(self.loader.list_available_models)
+        self.total_models = len(available_models)
+
+        if HTTPX_AVAILABLE:
+            # HTTP/2 multiplexes every stream over one connection
+            async with httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+                headers=self.loader._get_headers()
+            ) as client:
+                paths = await asyncio.gather(
+                    *(self.loader._adownload_http2(client, m["name"]) for m in available_models)
+                )
+        else:
+            async with aiohttp.ClientSession(
+                headers=self.loader._get_headers(),
+                connector=aiohttp.TCPConnector(limit=10)
+            ) as session:
+                paths = await asyncio.gather(
+                    *(self.loader._adownload(session, m["name"]) for m in available_models)
+                )
+
+        for model_info, path in zip(available_models, paths):
+            model_name = model_info["name"]
+            if path is None:
+                logger.warning(f"Failed to download: {model_name}")
+                continue
+
+            model = await asyncio.to_thread(self.loader.load_model, model_name)
+            if model is not None:
+                self.models[model_name] = model
+                self.model_info[model_name] = model_info
+                logger.info(f"Successfully loaded: {model_name}")
+            else:
+                logger.warning(f"Failed to load: {model_name}")
+
+        logger.info(f"Loaded {len(self.models)} models successfully")
+        return self.models
+
+    def load_all_models_concurrent(self) -> Dict[str, Any]:
+        """
+        Synchronous wrapper around aload_all_models
+
+        Returns:
+            Dictionary of loaded models
+        """
+        return asyncio.run(self.aload_all_models())
+
     def get_model(self, model_name: str) -> Optional[Any]:
         """
         Get a specific model
@@ -336,7 +1075,17 @@ class ModelManager:
             Model object, or None if not found
         """
         return self.models.get(model_name)
-    
+
+    @property
+    def loaded_count(self) -> int:
+        """Number of models currently loaded, as an O(1) read"""
+        return len(self.models)
+
+    @property
+    def total_count(self) -> int:
+        """Number of models known from the repository listing, O(1)"""
+        return self.total_models
+
     def get_model_status(self) -> Dict[str, Dict[str, Any]]:
         """
         Get status of all models
@@ -345,13 +1094,17 @@ class ModelManager:
             Dictionary with model status information
         """
         status = {}
-        for model_name, model in self.models.items():
+        for model_name in self.models:
+            # Report the on-disk size already known from the repository
+            # listing; stringifying the model graph just to measure it can
+            # materialize a >100MB repr for large estimators
+            info = self.model_info.get(model_name, {})
             status[model_name] = {
                 "loaded": True,
-                "size": len(str(model)) if model else 0,
-                "info": self.model_info.get(model_name, {})
+                "size": info.get("size", 0),
+                "info": info
             }
-        
+
         return status
     
     def refresh_models(self) -> Dict[str, Any]:
@@ -367,13 +1120,17 @@ class ModelManager:
 
 
 # Example usage and configuration
+@functools.lru_cache(maxsize=4)
 def create_model_manager_from_config(config_file: str = "github_config.json") -> ModelManager:
     """
     Create a ModelManager from configuration file
-    
+
+    Memoized per config path so Streamlit reruns share one manager (and
+    its connection pool) instead of building a new one per interaction.
+
     Args:
         config_file: Path to configuration file
-        
+
     Returns:
         ModelManager instance
     """
@@ -1,205 +1,65 @@
 import streamlit as st
 import json
-import pandas as pd
-import numpy as np
 import os
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple
 import sys
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
 
-# Add the current directory to Python path (Colab compatible)
-import os
+# plotly and numpy are deliberately not imported here: nothing on the
+# current render path uses them, and plotly alone adds seconds of cold
+# import time. Import them inside the function that draws a chart if
+# one is added later.
+
+# Add the current directory to Python path (Colab compatible); guard so
+# long-lived sessions don't grow sys.path on every rerun
 current_dir = os.getcwd()
-sys.path.append(current_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
 
 # Import GitHub model loader
 try:
-    from github_model_loader import ModelManager, create_model_manager_from_config
+    from github_model_loader import ModelManager
     GITHUB_MODELS_AVAILABLE = True
 except ImportError:
     GITHUB_MODELS_AVAILABLE = False
     st.warning("GitHub model loader not available. Using local models only.")
 
-# Custom CSS for refined professional styling
-st.markdown("""
-<style>
-    /* Professional styling with better hierarchy */
-    .main .block-container {
-        padding-top: 1rem;
-        padding-bottom: 2rem;
-        max-width: 1200px;
-    }
-    
-    /* Sidebar styling with improved spacing */
-    .sidebar .sidebar-content {
-        background: linear-gradient(180deg, #f8f9fa, #e9ecef);
-        padding-top: 1rem;
-    }
-    
-    .sidebar .sidebar-content .block-container {
-        padding-top: 0.5rem;
-        padding-left: 1rem;
-        padding-right: 1rem;
-    }
-    
-    /* Professional header */
-    .main-header {
-        padding: 1.5rem;
-        margin-bottom: 1.5rem;
-    }
-    
-    .main-header h1 {
-        font-size: 1.8rem;
-        margin-bottom: 0.5rem;
-    }
-    
-    .main-header p {
-        font-size: 1rem;
-        margin-bottom: 0.5rem;
-    }
-    
-    /* Better section spacing and hierarchy */
-    .section-header {
-        padding: 1rem;
-        margin: 1.5rem 0 1rem 0;
-        font-size: 1.2rem;
-    }
-    
-    /* Improved sidebar elements */
-    .sidebar .stSlider {
-        margin-bottom: 0.5rem;
-    }
-    
-    .sidebar .stSelectbox {
-        margin-bottom: 0.5rem;
-    }
-    
-    .sidebar .stCheckbox {
-        margin-bottom: 0.3rem;
-    }
-    
-    .sidebar .stMarkdown h3 {
-        font-size: 1rem;
-        margin-bottom: 0.5rem;
-    }
-    
-    /* Hide default Streamlit header */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Professional footer */
-    .footer {
-        padding: 1.5rem;
-        margin-top: 2rem;
-        background: linear-gradient(135deg, #343a40 0%, #495057 100%);
-        color: white;
-        text-align: center;
-        border-radius: 12px;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    
-    .footer h3 {
-        font-size: 1rem;
-        margin-bottom: 0.5rem;
-        font-weight: 300;
-        letter-spacing: 1px;
-    }
-    
-    .footer p {
-        font-size: 0.9rem;
-        margin: 0.2rem 0;
-    }
-    
-    /* Better spacing for main content */
-    .main .block-container > div {
-        margin-bottom: 1rem;
-    }
-    
-    /* Improved metric cards */
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        color: white;
-        text-align: center;
-        box-shadow: 0 6px 20px rgba(0, 0, 0, 0.1);
-        margin: 0.5rem;
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.15);
-    }
-    
-    /* Better button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.8rem 2rem;
-        font-weight: 500;
-        font-size: 1rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-        letter-spacing: 0.5px;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0, 0, 0, 0.15);
-        background: linear-gradient(135deg, #218838 0%, #1ea085 100%);
-    }
-    
-    /* Image styling */
-    .stImage > img {
-        border-radius: 12px;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-    }
-    
-    .stImage > img:hover {
-        transform: scale(1.02);
-        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
-    }
-    
-    /* Enhanced info boxes */
-    .stAlert {
-        border-radius: 10px;
-        border: none;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Better section headers */
-    h2 {
-        color: #1e3c72;
-        border-bottom: 3px solid #4CAF50;
-        padding-bottom: 0.5rem;
-        margin-bottom: 1.5rem;
-    }
-    
-    h3 {
-        color: #2a5298;
-        margin-bottom: 1rem;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Initialize GitHub model manager
+# Custom CSS for refined professional styling, built once at import time
+from pathlib import Path
+
 @st.cache_resource
+def _load_css() -> str:
+    """Read the stylesheet from disk once per process"""
+    return f"<style>{Path('styles.css').read_text()}</style>"
+
+# The style element must be re-emitted on every rerun — Streamlit drops
+# elements that aren't re-created — but the disk read and string build
+# above happen once per process thanks to the cache
+st.markdown(_load_css(), unsafe_allow_html=True)
+
+@st.cache_data(persist="disk")
+def _load_gh_config(path: str, mtime: float) -> dict:
+    """Parse the GitHub config, persisted to disk across restarts
+
+    Keyed on the file's mtime so an edited config invalidates the entry;
+    warm container restarts skip the read + JSON parse entirely.
+    """
+    return json.loads(Path(path).read_text())
+
+# Initialize GitHub model manager (cached via _bootstrap below)
 def initialize_model_manager():
     """Initialize the GitHub model manager"""
     if GITHUB_MODELS_AVAILABLE:
         try:
             # Try to load from config file
             if os.path.exists("github_config.json"):
-                return create_model_manager_from_config("github_config.json")
+                cfg = _load_gh_config("github_config.json",
+                                      os.path.getmtime("github_config.json"))
+                return ModelManager(
+                    github_repo=cfg["github_repo"],
+                    branch=cfg.get("branch", "main"),
+                    token=cfg.get("token")
+                )
             else:
                 # Use default configuration
                 return ModelManager("Afrah-create/agricultural-advisory-system")
@@ -208,59 +68,38 @@ def initialize_model_manager():
             return None
     return None
 
-# Initialize model manager
-model_manager = initialize_model_manager()
-
 # Import your components
-try:
-    # Try importing from files
-    from cell_32_constrained_decoding import AgronomicRuleEngine
-    from cell_33_uncertainty_calibration import UncertaintyCalibrator
-    from cell_34_cropping_planner import MultiObjectiveCroppingPlanner, SoilProfile, ResourceConstraints
-    from cell_35_integrated_system import IntegratedAgriculturalAdvisor
-except ImportError:
-    # Fallback: create minimal versions
+@st.cache_resource
+def _load_components():
+    """Resolve the advisory component classes once per process
+
+    The import attempt (and its fallback) runs a single time instead of
+    paying the import-machinery lookups on every rerun. Returns the four
+    classes plus a flag for whether the fallbacks were used.
+    """
+    try:
+        # Try importing from files
+        from cell_32_constrained_decoding import AgronomicRuleEngine
+        from cell_33_uncertainty_calibration import UncertaintyCalibrator
+        from cell_34_cropping_planner import MultiObjectiveCroppingPlanner
+        from cell_35_integrated_system import IntegratedAgriculturalAdvisor
+        fallback = False
+    except ImportError:
+        # Fallback: minimal stand-ins defined once in their own module
+        from _fallbacks import (
+            AgronomicRuleEngine,
+            UncertaintyCalibrator,
+            MultiObjectiveCroppingPlanner,
+            IntegratedAgriculturalAdvisor,
+        )
+        fallback = True
+    return (AgronomicRuleEngine, UncertaintyCalibrator,
+            MultiObjectiveCroppingPlanner, IntegratedAgriculturalAdvisor), fallback
+
+(AgronomicRuleEngine, UncertaintyCalibrator,
+ MultiObjectiveCroppingPlanner, IntegratedAgriculturalAdvisor), _using_fallbacks = _load_components()
+if _using_fallbacks:
     st.warning("Some components not available. Using simplified version.")
-    
-    class AgronomicRuleEngine:
-        def __init__(self):
-            pass
-        def validate_recommendation(self, soil_profile, crop_recommendation):
-            return {"is_valid": True, "violations": [], "confidence_score": 0.8}
-    
-    class UncertaintyCalibrator:
-        def __init__(self):
-            pass
-        def calibrate_prediction_uncertainty(self, predictions, true_labels):
-            return {"confidence_level": 0.95, "calibration_metrics": {"empirical_coverage": 0.95}}
-    
-    class MultiObjectiveCroppingPlanner:
-        def __init__(self):
-            pass
-        def plan_cropping_system(self, soil_profile, constraints, objectives):
-            return {"summary": {"crops": ["maize", "beans"], "total_yield": 5000, "total_cost": 3000, "total_profit": 2000}}
-    
-    class IntegratedAgriculturalAdvisor:
-        def __init__(self):
-            self.rule_engine = AgronomicRuleEngine()
-            self.uncertainty_calibrator = UncertaintyCalibrator()
-            self.cropping_planner = MultiObjectiveCroppingPlanner()
-        def analyze_soil_and_recommend(self, soil_data, constraints, objectives):
-            return {
-                "executive_summary": {
-                    "soil_quality_score": 0.7,
-                    "recommended_crops": ["maize", "beans"],
-                    "overall_recommendation_valid": True,
-                    "uncertainty_level": "medium"
-                },
-                "detailed_analysis": {
-                    "soil_analysis": {"strengths": ["Good pH"], "weaknesses": ["Low organic matter"]},
-                    "recommendations": {"crops": ["maize", "beans"], "confidence": 0.8, "source": "github_models"},
-                    "cropping_plan": {"summary": {"total_yield": 5000, "total_cost": 3000, "total_profit": 2000}}
-                },
-                "actionable_recommendations": ["Apply organic matter", "Plant maize and beans"],
-                "risk_assessment": {"high_risk_factors": [], "medium_risk_factors": ["Weather variability"], "low_risk_factors": [], "mitigation_strategies": []}
-            }
 
 # Page configuration
 st.set_page_config(
@@ -271,11 +110,97 @@ st.set_page_config(
 )
 
 # Professional Agricultural Advisory System
-from datetime import datetime
 
-# Professional App Header
-st.markdown("""
-<div style="background: linear-gradient(135deg, #1e3c72, #2a5298); color: white; 
+# Static card template shared by the executive-summary metrics; the
+# markup is parsed once here instead of rebuilt as an f-string per card
+METRIC_CARD = (
+    '<div class="metric-card">'
+    '<div style="font-size: 1.4rem; font-weight: 600;">{value}</div>'
+    '<div style="font-size: 0.9rem; opacity: 0.9;">{label}</div>'
+    '</div>'
+)
+
+# Static sidebar banner and footer, hoisted next to the other templates
+# so the literals are parsed once at import rather than per rerun
+SIDEBAR_BANNER = """
+<div style="text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%); border-radius: 12px; margin-bottom: 1.5rem; box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);">
+    <h2 style="color: white; margin: 0; font-weight: 300; letter-spacing: 1px;">Soil Profile Analysis</h2>
+</div>
+"""
+
+FOOTER_HTML = """
+<div class="footer">
+    <h3>Agricultural Advisory System for Uganda</h3>
+    <p>Evidence-backed crop recommendations for smallholder farmers</p>
+    <div style="margin-top: 1rem;">
+        <span style="margin: 0 1rem; font-size: 0.9rem;">Built with Streamlit</span>
+        <span style="margin: 0 1rem; font-size: 0.9rem;">Powered by GitHub Models</span>
+        <span style="margin: 0 1rem; font-size: 0.9rem;">Version 2.0</span>
+    </div>
+    <p style="margin-top: 1rem; font-size: 0.9rem; opacity: 0.8;">
+        © 2024 Agricultural Advisory System. All rights reserved.
+    </p>
+</div>
+"""
+
+# Static report section headers, built once at import instead of being
+# re-parsed inside the Analyze branch on every rerun
+SECTION_DETAILED = '<div class="section-header">Detailed Analysis</div>'
+SECTION_EXEC_SUMMARY = "### 📊 Executive Summary"
+SECTION_SOIL = "### 🌱 Soil Analysis"
+SECTION_CROPS = "### 🌾 Crop Recommendations"
+SECTION_PLAN = "### 📋 Cropping Plan"
+SECTION_ACTIONS = "### ✅ Actionable Recommendations"
+SECTION_RISK = "### ⚠️ Risk Assessment"
+
+
+class SoilData(NamedTuple):
+    """Immutable soil profile — hashable, so it doubles as a cache key"""
+    pH: float
+    organic_matter: float
+    nitrogen: int
+    phosphorus: int
+    potassium: int
+    texture: str
+    drainage: str
+    location: str = "Uganda"
+
+
+class Constraints(NamedTuple):
+    """Immutable farm constraints, same hashability rationale as SoilData"""
+    total_area: float
+    budget: int
+    labor_availability: float
+    water_availability: float
+    fertilizer_nitrogen: int
+    fertilizer_phosphorus: int
+    fertilizer_potassium: int
+
+
+# (level, icon, st-method for the empty case, empty-case message) for the
+# risk assessment section — the three levels only differ in these fields
+RISK_LEVELS = (
+    ("high", "🔴", "success", "✅ No high-risk factors identified"),
+    ("medium", "🟡", "success", "✅ No medium-risk factors identified"),
+    ("low", "🟢", "info", "ℹ️ No low-risk factors identified"),
+)
+
+# Per-item line templates for the buffered report sections, compiled
+# once here instead of re-evaluated as f-strings inside render loops
+_LIST_ITEM = "- {text}"
+_NUMBERED_ITEM = "{n}. {text}"
+_SECTION_HEADING = "**{icon} {title}:**\n"
+
+@st.cache_data(ttl=60)
+def _header_html():
+    """Build the header once per minute instead of on every rerun
+
+    An f-string rather than str.format so the template isn't re-scanned
+    for placeholders when the cache does roll over.
+    """
+    now = datetime.now()
+    return f"""
+<div style="background: linear-gradient(135deg, #1e3c72, #2a5298); color: white;
             padding: 1.5rem; border-radius: 10px; margin-bottom: 1.5rem; text-align: center;
             box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);">
     <h1 style="margin: 0 0 0.5rem 0; font-size: 1.8rem; font-weight: 600;">
@@ -285,13 +210,12 @@ st.markdown("""
         Evidence-backed crop recommendations for Uganda
     </p>
     <p style="margin: 0; font-size: 0.9rem; opacity: 0.8;">
-        {current_date} • {current_time}
+        {now.strftime("%B %d, %Y")} • {now.strftime("%I:%M %p")}
     </p>
 </div>
-""".format(
-    current_date=datetime.now().strftime("%B %d, %Y"),
-    current_time=datetime.now().strftime("%I:%M %p")
-), unsafe_allow_html=True)
+"""
+
+st.markdown(_header_html(), unsafe_allow_html=True)
 
 # Add spacing
 st.markdown("---")
@@ -360,206 +284,272 @@ with col2:
 
 st.markdown("---")
 
-# Initialize the advisor with GitHub models
-@st.cache_resource
-def initialize_advisor():
-    """Initialize the advisor with GitHub models if available"""
-    if model_manager and GITHUB_MODELS_AVAILABLE:
+@st.cache_resource(ttl=3600, max_entries=2)
+def _loaded_models(_manager):
+    """Load the GitHub PKL models once per process
+
+    Advisors reference this shared dict rather than holding their own
+    copies, so clearing this cache (plus gc) is enough to release the
+    old models after a config change. The manager argument is excluded
+    from the cache key (leading underscore).
+    """
+    return _manager.load_all_models()
+
+# (model file, advisor attribute) pairs; the setup loop below binds
+# whichever of these actually loaded
+MODEL_BINDINGS = (
+    ("cropping_planner.pkl", "cropping_planner_model"),
+    ("integrated_advisor.pkl", "integrated_model"),
+    ("rule_engine.pkl", "rule_engine_model"),
+    ("uncertainty_calibrator.pkl", "uncertainty_model"),
+)
+
+# Initialize the advisor with GitHub models (cached via _bootstrap below)
+def initialize_advisor(model_manager):
+    """Initialize the advisor with GitHub models if available
+
+    Returns the advisor plus (level, message) feedback tuples; rendering
+    the messages is left to the caller so load status stays visible on
+    every run instead of only when the cache is first populated.
+    """
+    messages = []
+    if HAS_GITHUB and model_manager is not None:
         try:
-            # Load models from GitHub
-            models = model_manager.load_all_models()
-            
+            # Load models from GitHub (shared, process-wide)
+            models = _loaded_models(model_manager)
+
             # Create enhanced advisor with GitHub models
             advisor = IntegratedAgriculturalAdvisor()
-            
-            # Load GitHub PKL models into advisor
-            if "cropping_planner.pkl" in models:
-                advisor.cropping_planner_model = models["cropping_planner.pkl"]
-                st.success("Cropping planner model loaded from GitHub")
-            
-            if "integrated_advisor.pkl" in models:
-                advisor.integrated_model = models["integrated_advisor.pkl"]
-                st.success("Integrated advisor model loaded from GitHub")
-            
-            if "rule_engine.pkl" in models:
-                advisor.rule_engine_model = models["rule_engine.pkl"]
-                st.success("Rule engine model loaded from GitHub")
-            
-            if "uncertainty_calibrator.pkl" in models:
-                advisor.uncertainty_model = models["uncertainty_calibrator.pkl"]
-                st.success("Uncertainty calibrator model loaded from GitHub")
-            
-            return advisor
-            
+
+            # Bind whichever GitHub PKL models loaded, then report them in
+            # one aggregated message instead of one widget per model
+            loaded = []
+            for name, attr in MODEL_BINDINGS:
+                if name in models:
+                    setattr(advisor, attr, models[name])
+                    loaded.append(name)
+            if loaded:
+                messages.append(("success", f"Loaded from GitHub: {', '.join(loaded)}"))
+
+            return advisor, messages
+
         except Exception as e:
-            st.error(f"Failed to load GitHub models: {e}")
-            return IntegratedAgriculturalAdvisor()
+            messages.append(("error", f"Failed to load GitHub models: {e}"))
+            return IntegratedAgriculturalAdvisor(), messages
     else:
-        return IntegratedAgriculturalAdvisor()
-
-advisor = initialize_advisor()
+        return IntegratedAgriculturalAdvisor(), messages
+
+@st.cache_resource(ttl=3600, max_entries=2)
+def _bootstrap():
+    """Initialize the model manager in one cached call
+
+    Only the (cheap) manager is built at import time; the heavy model
+    downloads happen lazily in _get_advisor on first analysis, so first
+    page paint never waits on pickle loads.
+    """
+    return initialize_model_manager()
+
+model_manager = _bootstrap()
+
+# Single truth for the GitHub-backed path, computed once per rerun so
+# downstream code doesn't repeat the two-part check
+HAS_GITHUB = GITHUB_MODELS_AVAILABLE and model_manager is not None
+
+@st.cache_resource(ttl=3600, max_entries=2, show_spinner=False)
+def _get_advisor(_manager):
+    """Lazy advisor singleton — built the first time an analysis runs
+
+    The underscore prefix excludes the manager from the cache key
+    entirely, so there is one entry per process regardless of manager;
+    the refresh handler clears this cache explicitly when the manager
+    is rebuilt.
+    """
+    return initialize_advisor(_manager)
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def run_analysis(soil_json: str, constraints_json: str, objectives_key: tuple):
+    """Memoized wrapper around the advisor pipeline
+
+    Inputs arrive as sorted JSON strings and a tuple so the cache key is
+    hashable; repeat analyses with the same parameters return from the
+    cache instead of rerunning inference.
+    """
+    advisor, _ = _get_advisor(model_manager)
+    return advisor.analyze_soil_and_recommend(
+        json.loads(soil_json), json.loads(constraints_json), list(objectives_key)
+    )
 
 # System Status (Simplified)
 st.sidebar.markdown("### System Status")
 
-if model_manager and GITHUB_MODELS_AVAILABLE:
+@st.cache_data(ttl=30)
+def _status_snapshot(manager_id: int):
+    """Snapshot the model status at most every 30s instead of per rerun
+
+    Keyed on the manager's id so a replaced manager busts the entry.
+    """
+    return model_manager.get_model_status()
+
+if HAS_GITHUB:
     try:
-        status = model_manager.get_model_status()
-        loaded_models = sum(1 for info in status.values() if info["loaded"])
-        total_models = len(status)
-        
-        if loaded_models == total_models:
-            st.sidebar.success("✓ All models loaded successfully")
+        # O(1) counters maintained by the manager, no per-rerun scan
+        loaded_models = model_manager.loaded_count
+        total_models = model_manager.total_count
+
+        if total_models == 0:
+            # Loading is deferred: nothing has been fetched before the
+            # first analysis, which is not the same as "all loaded"
+            st.sidebar.info("ℹ Models load on first analysis")
         else:
-            st.sidebar.warning(f"⚠ {loaded_models}/{total_models} models loaded")
+            if loaded_models == total_models:
+                st.sidebar.success("✓ All models loaded successfully")
+            else:
+                st.sidebar.warning(f"⚠ {loaded_models}/{total_models} models loaded")
+
+            # Per-model detail as one markdown table — a single element
+            # instead of one st.sidebar.text per model
+            status = _status_snapshot(id(model_manager))
+            rows = "\n".join(
+                f"| {'✅' if info['loaded'] else '❌'} | {name} |"
+                for name, info in status.items()
+            )
+            st.sidebar.markdown(f"| | Model |\n|-|-|\n{rows}")
     except:
         st.sidebar.info("ℹ Using offline mode")
 else:
     st.sidebar.info("ℹ Using offline mode")
 
+# Targeted refresh: clear only the model caches, not every cached
+# resource, so unrelated singletons survive the rerun
+if st.sidebar.button("🔄 Refresh models", use_container_width=True):
+    _loaded_models.clear()
+    _bootstrap.clear()
+    _get_advisor.clear()
+    _status_snapshot.clear()
+    # Reports computed with the old models are stale too: drop both the
+    # memoized analyses and the session copy kept for re-rendering
+    run_analysis.clear()
+    st.session_state.pop("report", None)
+    st.session_state.pop("report_key", None)
+    st.session_state.pop("_advisor_msgs_done", None)
+    st.rerun()
+
 st.sidebar.markdown("---")
 
 # Professional Sidebar
-st.sidebar.markdown("""
-<div style="text-align: center; padding: 1.5rem; background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%); border-radius: 12px; margin-bottom: 1.5rem; box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);">
-    <h2 style="color: white; margin: 0; font-weight: 300; letter-spacing: 1px;">Soil Profile Analysis</h2>
-</div>
-""", unsafe_allow_html=True)
-
-# Soil properties input with icons and better styling
-st.sidebar.markdown("### Soil Properties")
-
-ph = st.sidebar.slider(
-    "pH Level", 
-    4.0, 9.0, 6.5, 0.1,
-    help="Soil acidity/alkalinity level"
-)
-
-organic_matter = st.sidebar.slider(
-    "Organic Matter (%)", 
-    0.0, 10.0, 2.0, 0.1,
-    help="Percentage of organic matter in soil"
-)
-
-nitrogen = st.sidebar.slider(
-    "Nitrogen (kg/ha)", 
-    0, 200, 50, 5,
-    help="Available nitrogen content"
-)
-
-phosphorus = st.sidebar.slider(
-    "Phosphorus (kg/ha)", 
-    0, 100, 15, 1,
-    help="Available phosphorus content"
-)
-
-potassium = st.sidebar.slider(
-    "Potassium (kg/ha)", 
-    0, 300, 120, 5,
-    help="Available potassium content"
-)
-
-# Soil texture and drainage
-st.sidebar.markdown("### Soil Characteristics")
-texture = st.sidebar.selectbox(
-    "Soil Texture", 
-    ["sand", "sandy_loam", "loam", "clay_loam", "clay"],
-    help="Physical composition of the soil"
-)
-
-drainage = st.sidebar.selectbox(
-    "Drainage", 
-    ["poor", "moderate", "good", "excellent"],
-    help="How well water drains through the soil"
-)
-
-# Resource constraints with better styling
-st.sidebar.markdown("### Farm Constraints")
-total_area = st.sidebar.slider(
-    "Farm Area (hectares)", 
-    0.1, 10.0, 2.0, 0.1,
-    help="Total farm area available for cultivation"
-)
-
-budget = st.sidebar.slider(
-    "Budget (USD)", 
-    1000, 20000, 5000, 500,
-    help="Available budget for farming activities"
-)
-
-labor_availability = st.sidebar.slider(
-    "Labor Availability (person-days)", 
-    50, 500, 200, 10,
-    help="Available labor in person-days"
-)
-
-water_availability = st.sidebar.slider(
-    "Water Availability (mm)", 
-    500, 2000, 1200, 50,
-    help="Available water resources in millimeters"
-)
-
-# Fertilizer availability
-st.sidebar.markdown("### Fertilizer Availability")
-fertilizer_nitrogen = st.sidebar.slider(
-    "Nitrogen Fertilizer (kg)", 
-    50, 500, 200, 10,
-    help="Available nitrogen fertilizer"
-)
-
-fertilizer_phosphorus = st.sidebar.slider(
-    "Phosphorus Fertilizer (kg)", 
-    20, 200, 80, 5,
-    help="Available phosphorus fertilizer"
-)
-
-fertilizer_potassium = st.sidebar.slider(
-    "Potassium Fertilizer (kg)", 
-    50, 300, 150, 10,
-    help="Available potassium fertilizer"
-)
-
-# Objectives with better styling
-st.sidebar.markdown("### Optimization Objectives")
-maximize_yield = st.sidebar.checkbox("Maximize Yield", True)
-minimize_cost = st.sidebar.checkbox("Minimize Cost", True)
-maximize_profit = st.sidebar.checkbox("Maximize Profit", True)
+st.sidebar.markdown(SIDEBAR_BANNER, unsafe_allow_html=True)
+
+# All inputs live in one form so dialing in a dozen widgets triggers a
+# single rerun on submit instead of one rerun per value change
+with st.sidebar.form("soil_form"):
+    # Soil properties input with icons and better styling
+    st.markdown("### Soil Properties")
+
+    ph = st.slider(
+        "pH Level",
+        4.0, 9.0, 6.5, 0.1,
+        help="Soil acidity/alkalinity level"
+    )
+
+    organic_matter = st.slider(
+        "Organic Matter (%)",
+        0.0, 10.0, 2.0, 0.1,
+        help="Percentage of organic matter in soil"
+    )
+
+    nitrogen = st.slider(
+        "Nitrogen (kg/ha)",
+        0, 200, 50, 5,
+        help="Available nitrogen content"
+    )
+
+    phosphorus = st.slider(
+        "Phosphorus (kg/ha)",
+        0, 100, 15, 1,
+        help="Available phosphorus content"
+    )
+
+    potassium = st.slider(
+        "Potassium (kg/ha)",
+        0, 300, 120, 5,
+        help="Available potassium content"
+    )
+
+    # Soil texture and drainage
+    st.markdown("### Soil Characteristics")
+    texture = st.selectbox(
+        "Soil Texture",
+        ["sand", "sandy_loam", "loam", "clay_loam", "clay"],
+        help="Physical composition of the soil"
+    )
+
+    drainage = st.selectbox(
+        "Drainage",
+        ["poor", "moderate", "good", "excellent"],
+        help="How well water drains through the soil"
+    )
+
+    # Resource constraints with better styling
+    st.markdown("### Farm Constraints")
+    total_area = st.slider(
+        "Farm Area (hectares)",
+        0.1, 10.0, 2.0, 0.1,
+        help="Total farm area available for cultivation"
+    )
+
+    budget = st.slider(
+        "Budget (USD)",
+        1000, 20000, 5000, 500,
+        help="Available budget for farming activities"
+    )
+
+    labor_availability = st.slider(
+        "Labor Availability (person-days)",
+        50, 500, 200, 10,
+        help="Available labor in person-days"
+    )
+
+    water_availability = st.slider(
+        "Water Availability (mm)",
+        500, 2000, 1200, 50,
+        help="Available water resources in millimeters"
+    )
+
+    # Fertilizer availability
+    st.markdown("### Fertilizer Availability")
+    fertilizer_nitrogen = st.slider(
+        "Nitrogen Fertilizer (kg)",
+        50, 500, 200, 10,
+        help="Available nitrogen fertilizer"
+    )
+
+    fertilizer_phosphorus = st.slider(
+        "Phosphorus Fertilizer (kg)",
+        20, 200, 80, 5,
+        help="Available phosphorus fertilizer"
+    )
+
+    fertilizer_potassium = st.slider(
+        "Potassium Fertilizer (kg)",
+        50, 300, 150, 10,
+        help="Available potassium fertilizer"
+    )
+
+    # Objectives with better styling
+    st.markdown("### Optimization Objectives")
+    maximize_yield = st.checkbox("Maximize Yield", True)
+    minimize_cost = st.checkbox("Minimize Cost", True)
+    maximize_profit = st.checkbox("Maximize Profit", True)
+
+    submitted = st.form_submit_button(
+        "🔍 Analyze Soil & Generate Recommendations",
+        type="primary",
+        use_container_width=True
+    )
 
 # Main Content Section
 st.markdown("### Soil Analysis & Recommendations")
 
-# Prepare soil data (moved outside button for proper scope)
-soil_data = {
-    "pH": ph,
-    "organic_matter": organic_matter,
-    "nitrogen": nitrogen,
-    "phosphorus": phosphorus,
-    "potassium": potassium,
-    "texture": texture,
-    "drainage": drainage,
-    "location": "Uganda"
-}
-
-# Prepare constraints
-constraints = {
-    "total_area": total_area,
-    "budget": budget,
-    "labor_availability": labor_availability,
-    "water_availability": water_availability,
-    "fertilizer_nitrogen": fertilizer_nitrogen,
-    "fertilizer_phosphorus": fertilizer_phosphorus,
-    "fertilizer_potassium": fertilizer_potassium
-}
-
-# Prepare objectives
-objectives = []
-if maximize_yield:
-    objectives.append("maximize_yield")
-if minimize_cost:
-    objectives.append("minimize_cost")
-if maximize_profit:
-    objectives.append("maximize_profit")
-
 # Main Content Section with better organization
 st.markdown("---")
 
@@ -581,170 +571,192 @@ with col3:
     st.metric("Potassium", f"{potassium} kg/ha")
     st.metric("Soil Texture", texture.title())
 
-# Analysis button with better styling
+# Analysis runs when the sidebar form is submitted
 st.markdown("---")
-if st.button("🔍 Analyze Soil & Generate Recommendations", type="primary", use_container_width=True):
-    
-    # Generate comprehensive analysis
+if submitted:
+    # Build the analysis inputs only when an analysis is actually
+    # requested, not on every widget-triggered rerun
+    soil_data = SoilData(
+        pH=ph,
+        organic_matter=organic_matter,
+        nitrogen=nitrogen,
+        phosphorus=phosphorus,
+        potassium=potassium,
+        texture=texture,
+        drainage=drainage,
+    )
+
+    constraints = Constraints(
+        total_area=total_area,
+        budget=budget,
+        labor_availability=labor_availability,
+        water_availability=water_availability,
+        fertilizer_nitrogen=fertilizer_nitrogen,
+        fertilizer_phosphorus=fertilizer_phosphorus,
+        fertilizer_potassium=fertilizer_potassium,
+    )
+
+    objectives = []
+    if maximize_yield:
+        objectives.append("maximize_yield")
+    if minimize_cost:
+        objectives.append("minimize_cost")
+    if maximize_profit:
+        objectives.append("maximize_profit")
+
+    # Reuse the previous report when the inputs haven't changed, so
+    # repeated clicks with identical parameters skip the full pipeline;
+    # NamedTuples hash directly, no sorting/tupling dance required
+    analysis_key = hash((soil_data, constraints, tuple(objectives)))
+
+    # Generate comprehensive analysis; the first submit also pays the
+    # (deferred) model-loading cost inside _get_advisor
     with st.spinner("Analyzing soil and generating recommendations..."):
         try:
-            report = advisor.analyze_soil_and_recommend(soil_data, constraints, objectives)
-            
-            # Professional success message with better styling
-            st.success("✅ Analysis Completed Successfully!")
-            st.info("Your soil analysis and crop recommendations are ready.")
-            
-            # Add spacing
-            st.markdown("<br>", unsafe_allow_html=True)
-            
-            # Executive Summary with neat tables
-            st.markdown("### 📊 Executive Summary")
-            
-            # Get summary from report
-            summary = report["executive_summary"]
-            
-            # Create summary metrics table
-            summary_data = {
-                "Metric": ["Soil Quality Score", "Recommended Crops", "Recommendation Status", "Uncertainty Level"],
-                "Value": [
-                    f"{summary['soil_quality_score']:.2f}",
-                    f"{len(summary['recommended_crops'])} crops",
-                    "Valid" if summary['overall_recommendation_valid'] else "Invalid",
-                    summary['uncertainty_level'].title()
-                ]
-            }
-            summary_df = pd.DataFrame(summary_data)
-            st.dataframe(summary_df, use_container_width=True, hide_index=True)
-            
-            # Detailed Analysis with professional styling
-            st.markdown('<div class="section-header">Detailed Analysis</div>', unsafe_allow_html=True)
-            
-            # Soil Analysis with neat tables
-            st.markdown("### 🌱 Soil Analysis")
-            soil_analysis = report["detailed_analysis"]["soil_analysis"]
-            
-            # Soil strengths table
-            if soil_analysis["strengths"]:
-                strengths_data = {
-                    "Soil Strengths": soil_analysis["strengths"]
-                }
-                strengths_df = pd.DataFrame(strengths_data)
-                st.markdown("**✅ Soil Strengths:**")
-                st.dataframe(strengths_df, use_container_width=True, hide_index=True)
-            else:
-                st.warning("No significant soil strengths identified")
-            
-            # Soil weaknesses table
-            if soil_analysis["weaknesses"]:
-                weaknesses_data = {
-                    "Areas for Improvement": soil_analysis["weaknesses"]
-                }
-                weaknesses_df = pd.DataFrame(weaknesses_data)
-                st.markdown("**⚠️ Areas for Improvement:**")
-                st.dataframe(weaknesses_df, use_container_width=True, hide_index=True)
-            else:
-                st.success("No significant soil weaknesses identified")
-            
-            # Crop Recommendations with neat tables
-            st.markdown("### 🌾 Crop Recommendations")
-            recommendations = report["detailed_analysis"]["recommendations"]
-            
-            # Recommended crops table
-            crops_data = {
-                "Recommended Crops": recommendations['crops']
-            }
-            crops_df = pd.DataFrame(crops_data)
-            st.dataframe(crops_df, use_container_width=True, hide_index=True)
-            
-            # Recommendation details table
-            rec_details_data = {
-                "Attribute": ["Confidence Level", "Data Source"],
-                "Value": [f"{recommendations['confidence']:.2f}", recommendations['source'].title()]
-            }
-            rec_details_df = pd.DataFrame(rec_details_data)
-            st.dataframe(rec_details_df, use_container_width=True, hide_index=True)
-            
-            # Cropping Plan with neat tables
-            if report["detailed_analysis"]["cropping_plan"]:
-                st.markdown("### 📋 Cropping Plan")
-                plan = report["detailed_analysis"]["cropping_plan"]
-                
-                if "error" not in plan:
-                    plan_summary = plan["summary"]
-                    
-                    # Economic metrics table
-                    economic_data = {
-                        "Metric": ["Total Yield", "Total Cost", "Total Profit"],
-                        "Value": [
-                            f"{plan_summary['total_yield']:.0f} kg",
-                            f"${plan_summary['total_cost']:.0f}",
-                            f"${plan_summary['total_profit']:.0f}"
-                        ]
-                    }
-                    economic_df = pd.DataFrame(economic_data)
-                    st.dataframe(economic_df, use_container_width=True, hide_index=True)
-            
-            # Actionable Recommendations with neat tables
-            st.markdown("### ✅ Actionable Recommendations")
-            
-            recommendations_data = {
-                "Priority": [f"{i}" for i in range(1, len(report["actionable_recommendations"]) + 1)],
-                "Recommendation": report["actionable_recommendations"]
-            }
-            recommendations_df = pd.DataFrame(recommendations_data)
-            st.dataframe(recommendations_df, use_container_width=True, hide_index=True)
-            
-            # Risk Assessment with neat tables
-            st.markdown("### ⚠️ Risk Assessment")
-            risk_assessment = report["risk_assessment"]
-            
-            # High risk factors table
-            if risk_assessment["high_risk_factors"]:
-                high_risk_data = {
-                    "High Risk Factors": risk_assessment["high_risk_factors"]
-                }
-                high_risk_df = pd.DataFrame(high_risk_data)
-                st.markdown("**🔴 High Risk Factors:**")
-                st.dataframe(high_risk_df, use_container_width=True, hide_index=True)
-            else:
-                st.success("✅ No high-risk factors identified")
-            
-            # Medium risk factors table
-            if risk_assessment["medium_risk_factors"]:
-                medium_risk_data = {
-                    "Medium Risk Factors": risk_assessment["medium_risk_factors"]
-                }
-                medium_risk_df = pd.DataFrame(medium_risk_data)
-                st.markdown("**🟡 Medium Risk Factors:**")
-                st.dataframe(medium_risk_df, use_container_width=True, hide_index=True)
-            else:
-                st.success("✅ No medium-risk factors identified")
-            
-            # Low risk factors table
-            if risk_assessment["low_risk_factors"]:
-                low_risk_data = {
-                    "Low Risk Factors": risk_assessment["low_risk_factors"]
-                }
-                low_risk_df = pd.DataFrame(low_risk_data)
-                st.markdown("**🟢 Low Risk Factors:**")
-                st.dataframe(low_risk_df, use_container_width=True, hide_index=True)
-            else:
-                st.info("ℹ️ No low-risk factors identified")
-            
-            # Mitigation strategies table
-            if risk_assessment["mitigation_strategies"]:
-                mitigation_data = {
-                    "Priority": [f"{i}" for i in range(1, len(risk_assessment["mitigation_strategies"]) + 1)],
-                    "Mitigation Strategy": risk_assessment["mitigation_strategies"]
-                }
-                mitigation_df = pd.DataFrame(mitigation_data)
-                st.markdown("**🛡️ Mitigation Strategies:**")
-                st.dataframe(mitigation_df, use_container_width=True, hide_index=True)
-        
+            if not st.session_state.get("_advisor_msgs_done"):
+                _, advisor_messages = _get_advisor(model_manager)
+                for level, msg in advisor_messages:
+                    getattr(st, level)(msg)
+                st.session_state["_advisor_msgs_done"] = True
+
+            if st.session_state.get("report_key") != analysis_key:
+                st.session_state["report"] = run_analysis(
+                    json.dumps(soil_data._asdict(), sort_keys=True),
+                    json.dumps(constraints._asdict(), sort_keys=True),
+                    tuple(objectives)
+                )
+                st.session_state["report_key"] = analysis_key
+
         except Exception as e:
+            st.session_state.pop("report", None)
+            st.session_state.pop("report_key", None)
             st.error(f"Analysis failed: {str(e)}")
             st.write("Please check your inputs and try again.")
 
+# Render from session state on every rerun: the report stays on screen
+# when later widget interactions trigger reruns without a resubmit, and
+# nothing is recomputed unless the inputs actually changed
+report = st.session_state.get("report")
+if report is not None:
+    try:
+        st.success("✅ Analysis Completed Successfully!")
+        st.info("Your soil analysis and crop recommendations are ready.")
+        
+        # Add spacing
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Get summary from report
+        summary = report["executive_summary"]
+
+        # Render the summary as metric cards from the shared template
+        summary_cards = [
+            (f"{summary['soil_quality_score']:.2f}", "Soil Quality Score"),
+            (f"{len(summary['recommended_crops'])} crops", "Recommended Crops"),
+            ("Valid" if summary['overall_recommendation_valid'] else "Invalid", "Recommendation Status"),
+            (summary['uncertainty_level'].title(), "Uncertainty Level")
+        ]
+        # Header and flexbox card row in one markdown message, instead
+        # of a heading widget plus four column containers
+        st.markdown(
+            SECTION_EXEC_SUMMARY + "\n\n"
+            + '<div style="display: flex; gap: 0.5rem;">'
+            + "".join(METRIC_CARD.format(value=value, label=label)
+                      for value, label in summary_cards)
+            + '</div>',
+            unsafe_allow_html=True
+        )
+
+        soil_analysis = report["detailed_analysis"]["soil_analysis"]
+
+        # The section headers join the buffered soil lists so the whole
+        # Detailed Analysis intro goes out as one message; only the
+        # empty cases fall back to their own status widgets
+        soil_buf = [SECTION_DETAILED, SECTION_SOIL]
+        if soil_analysis["strengths"]:
+            soil_buf.append(_SECTION_HEADING.format(icon="✅", title="Soil Strengths")
+                            + "\n".join(_LIST_ITEM.format(text=item)
+                                         for item in soil_analysis["strengths"]))
+        if soil_analysis["weaknesses"]:
+            soil_buf.append(_SECTION_HEADING.format(icon="⚠️", title="Areas for Improvement")
+                            + "\n".join(_LIST_ITEM.format(text=item)
+                                         for item in soil_analysis["weaknesses"]))
+        st.markdown("\n\n".join(soil_buf), unsafe_allow_html=True)
+        if not soil_analysis["strengths"]:
+            st.warning("No significant soil strengths identified")
+        if not soil_analysis["weaknesses"]:
+            st.success("No significant soil weaknesses identified")
+        
+        # Crop Recommendations with neat tables
+        st.markdown(SECTION_CROPS)
+        recommendations = report["detailed_analysis"]["recommendations"]
+        
+        # Recommended crops table; st.table takes the dict directly,
+        # no pandas round-trip for a handful of rows
+        st.table({"Recommended Crops": recommendations['crops']})
+        
+        # Recommendation details table
+        st.table({
+            "Attribute": ["Confidence Level", "Data Source"],
+            "Value": [f"{recommendations['confidence']:.2f}", recommendations['source'].title()]
+        })
+        
+        # Cropping Plan with neat tables
+        if report["detailed_analysis"]["cropping_plan"]:
+            st.markdown(SECTION_PLAN)
+            plan = report["detailed_analysis"]["cropping_plan"]
+            
+            if "error" not in plan:
+                plan_summary = plan["summary"]
+                
+                # Economic metrics table
+                st.table({
+                    "Metric": ["Total Yield", "Total Cost", "Total Profit"],
+                    "Value": [
+                        f"{plan_summary['total_yield']:.0f} kg",
+                        f"${plan_summary['total_cost']:.0f}",
+                        f"${plan_summary['total_profit']:.0f}"
+                    ]
+                })
+        
+        # Actionable Recommendations with neat tables
+        st.markdown(SECTION_ACTIONS)
+        
+        # Integer priority column — cheaper to serialize than the
+        # stringified ordinals it replaces
+        st.table({
+            "Priority": list(range(1, len(report["actionable_recommendations"]) + 1)),
+            "Recommendation": report["actionable_recommendations"]
+        })
+        
+        # Risk Assessment — header, the populated levels and the
+        # mitigation list go out as one buffered markdown message;
+        # empty levels keep their own status widgets below it
+        risk_assessment = report["risk_assessment"]
+        risk_buf = [SECTION_RISK]
+        empty_levels = []
+        for level, icon, empty_fn, empty_msg in RISK_LEVELS:
+            factors = risk_assessment[f"{level}_risk_factors"]
+            if factors:
+                risk_buf.append(_SECTION_HEADING.format(icon=icon,
+                                                        title=f"{level.capitalize()} Risk Factors")
+                                + "\n".join(_LIST_ITEM.format(text=item) for item in factors))
+            else:
+                empty_levels.append((empty_fn, empty_msg))
+
+        # Mitigation strategies, numbered by priority
+        if risk_assessment["mitigation_strategies"]:
+            risk_buf.append(_SECTION_HEADING.format(icon="🛡️", title="Mitigation Strategies")
+                            + "\n".join(_NUMBERED_ITEM.format(n=i, text=item) for i, item in
+                                         enumerate(risk_assessment["mitigation_strategies"], 1)))
+
+        st.markdown("\n\n".join(risk_buf))
+        for empty_fn, empty_msg in empty_levels:
+            getattr(st, empty_fn)(empty_msg)
+
+    except Exception as e:
+        st.error(f"Report rendering failed: {str(e)}")
+
+
 # System Information Panel with visual enhancements
 st.markdown("---")
 st.markdown("## ℹ️ System Information")
@@ -772,8 +784,9 @@ with tab2:
         "📋 Optimization planning for farming operations",
         "⚠️ Risk assessment and mitigation strategies"
     ]
-    for feature in features:
-        st.markdown(f"• {feature}")
+    # One markdown call for the whole list: each st.markdown is a separate
+    # frontend message, so emitting per item costs N round-trips
+    st.markdown("\n".join(f"• {feature}" for feature in features))
 
 with tab3:
     st.markdown("### Quick Statistics")
@@ -786,7 +799,7 @@ with tab3:
         st.metric("Farm Constraints", "7", help="Area, Budget, Labor, Water, Fertilizers")
     
     with col3:
-        st.metric("Optimization Goals", f"{len(objectives)}", help="Yield, Cost, Profit optimization")
+        st.metric("Optimization Goals", f"{sum([maximize_yield, minimize_cost, maximize_profit])}", help="Yield, Cost, Profit optimization")
 
 with tab4:
     st.markdown("### Image Gallery")
@@ -814,17 +827,4 @@ with tab4:
         """, unsafe_allow_html=True)
 
 # Professional Footer
-st.markdown("""
-<div class="footer">
-    <h3>Agricultural Advisory System for Uganda</h3>
-    <p>Evidence-backed crop recommendations for smallholder farmers</p>
-    <div style="margin-top: 1rem;">
-        <span style="margin: 0 1rem; font-size: 0.9rem;">Built with Streamlit</span>
-        <span style="margin: 0 1rem; font-size: 0.9rem;">Powered by GitHub Models</span>
-        <span style="margin: 0 1rem; font-size: 0.9rem;">Version 2.0</span>
-    </div>
-    <p style="margin-top: 1rem; font-size: 0.9rem; opacity: 0.8;">
-        © 2024 Agricultural Advisory System. All rights reserved.
-    </p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)